@@ -45,6 +45,9 @@ class ADS1220:
         self.sps = config.getchoice('sample_rate', self.sps_options,
                                     default='660')
         self.is_turbo = str(self.sps) in self.sps_turbo
+        # data rate register code is the index of the rate in its mode
+        sps_list = self.sps_turbo if self.is_turbo else self.sps_normal
+        self.data_rate = sorted(sps_list.values()).index(self.sps)
         # Input multiplexer: AINP and AINN
         mux_options = {'AIN0_AIN1': 0b0000, 'AIN0_AIN2': 0b0001,
                        'AIN0_AIN3': 0b0010, 'AIN1_AIN2': 0b0011,
@@ -85,8 +88,6 @@ class ADS1220:
         if drdy_pin_mcu != self.mcu:
             raise config.error("ADS1220 config error: SPI communication and"
                                " data_ready_pin must be on the same MCU")
-        # Bulk Sensor Setup
-        self.bulk_queue = bulk_sensor.BulkDataQueue(self.mcu, oid=self.oid)
         # Clock tracking
         chip_smooth = self.sps * UPDATE_INTERVAL * 2
         # Measurement conversion
@@ -188,10 +189,8 @@ class ADS1220:
     def setup_chip(self):
         continuous = 0x1  # enable continuous conversions
         mode = 0x2 if self.is_turbo else 0x0  # turbo mode
-        sps_list = self.sps_turbo if self.is_turbo else self.sps_normal
-        data_rate = list(sps_list.keys()).index(str(self.sps))
         reg_values = [(self.mux << 4) | (self.gain << 1) | int(self.pga_bypass),
-                      (data_rate << 5) | (mode << 3) | (continuous << 2),
+                      (self.data_rate << 5) | (mode << 3) | (continuous << 2),
                       (self.vref << 6),
                       0x0]
         self.write_reg(0x0, reg_values)
@@ -76,14 +76,14 @@ class BatchBulkHelper:
             return self.printer.get_reactor().NEVER
         if not msg:
             return eventtime + self.batch_interval
-        for client_cb in list(self.client_cbs):
-            res = client_cb(msg)
-            if not res:
-                # This client no longer needs updates - unregister it
-                self.client_cbs.remove(client_cb)
-                if not self.client_cbs:
-                    self._stop()
-                    return self.printer.get_reactor().NEVER
+        client_cbs = self.client_cbs
+        active_cbs = [client_cb for client_cb in client_cbs if client_cb(msg)]
+        if len(active_cbs) != len(client_cbs):
+            # Some clients no longer need updates - unregister them
+            self.client_cbs = active_cbs
+            if not active_cbs:
+                self._stop()
+                return self.printer.get_reactor().NEVER
         return eventtime + self.batch_interval
     # Client registration
     def add_client(self, client_cb):
@@ -180,7 +180,7 @@ class HTU21D:
                 )
             else:
                 self.temp = (0.002681 * float(rtemp) - 46.85)
-                logging.debug("htu21d: Temperature %.2f " % self.temp)
+                logging.debug("htu21d: Temperature %.2f ", self.temp)
 
             # Read Humidity
             if self.hold_master_mode:
@@ -217,7 +217,7 @@ class HTU21D:
                     logging.debug("htu21d: Do temp compensation..")
                     self.humidity = self.humidity
                     + (25.0 - self.temp) * HTU21D_TEMP_COEFFICIENT;
-                logging.debug("htu21d: Humidity %.2f " % self.humidity)
+                logging.debug("htu21d: Humidity %.2f ", self.humidity)
         except Exception:
             logging.exception("htu21d: Error reading data")
             self.temp = self.humidity = .0
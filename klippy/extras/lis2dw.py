@@ -193,7 +193,6 @@ class LIS2DW:
         self.query_lis2dw_cmd.send_wait_ack([self.oid, 0])
         self.ffreader.note_end()
         logging.info("LIS2DW finished '%s' measurements", self.name)
-        self.set_reg(REG_LIS2DW_FIFO_CTRL, 0x00)
     def _process_batch(self, eventtime):
         samples = self.ffreader.pull_samples()
         self._convert_samples(samples)
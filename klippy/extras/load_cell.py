@@ -31,11 +31,11 @@ class ApiClientHelper(object):
 
     # send data to clients
     def send(self, msg):
-        for client_cb in list(self.client_cbs):
-            res = client_cb(msg)
-            if not res:
-                # This client no longer needs updates - unregister it
-                self.client_cbs.remove(client_cb)
+        client_cbs = self.client_cbs
+        active_cbs = [client_cb for client_cb in client_cbs if client_cb(msg)]
+        if len(active_cbs) != len(client_cbs):
+            # Some clients no longer need updates - unregister them
+            self.client_cbs = active_cbs
 
     # Add a client that gets data callbacks
     def add_client(self, client_cb):
@@ -282,6 +282,7 @@ class LoadCellSampleCollector:
         self.max_time = float("inf")
         self.min_count = float("inf")  # In Python 3.5 math.inf is better
         self.is_started = False
+        self._completion = None
         self._samples = []
         self._errors = 0
         self._overflows = 0
@@ -300,6 +301,9 @@ class LoadCellSampleCollector:
                 self.is_started = False
         if len(self._samples) >= self.min_count:
             self.is_started = False
+        if not self.is_started and self._completion is not None:
+            # wake up _collect_until() without waiting for its next poll
+            self._completion.complete(True)
         return self.is_started
 
     def _finish_collecting(self):
@@ -319,16 +323,19 @@ class LoadCellSampleCollector:
 
     def _collect_until(self, timeout):
         self.start_collecting()
+        self._completion = completion = self._reactor.completion()
         while self.is_started:
             now = self._reactor.monotonic()
             if self._mcu.estimated_print_time(now) > timeout:
+                self._completion = None
                 self._finish_collecting()
                 raise self._printer.command_error(
                     "LoadCellSampleCollector timed out! Errors: %i,"
                     " Overflows: %i" % (self._errors, self._overflows))
             if self._mcu.is_fileoutput():
                 break
-            self._reactor.pause(now + RETRY_DELAY)
+            completion.wait(now + RETRY_DELAY)
+        self._completion = None
         return self._finish_collecting()
 
     # start collecting with no automatic end to collection
@@ -400,17 +407,21 @@ class LoadCell:
 
     # convert raw counts to grams and broadcast to clients
     def _sensor_data_event(self, msg):
-        data = msg.get("data")
-        errors = msg.get("errors")
-        overflows = msg.get("overflows")
-        if data is None:
-            return None
+        # Load variables to optimize inner loop below
+        tare_counts = self.tare_counts
+        counts_per_gram = self.counts_per_gram
+        invert = self.invert
+        is_valid = self.is_calibrated() and self.is_tared()
         samples = []
-        for row in data:
+        for row in msg['data']:
+            counts = row[1]
+            grams = None
+            if is_valid:
+                grams = invert * float(counts - tare_counts) / counts_per_gram
             # [time, grams, counts, tare_counts]
-            samples.append([row[0], self.counts_to_grams(row[1]), row[1],
-                            self.tare_counts])
-        msg = {'data': samples, 'errors': errors, 'overflows': overflows}
+            samples.append([row[0], grams, counts, tare_counts])
+        msg = {'data': samples, 'errors': msg['errors'],
+               'overflows': msg['overflows']}
         self.clients.send(msg)
         return True
 
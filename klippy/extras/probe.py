@@ -19,8 +19,7 @@ def calc_probe_z_average(positions, method='average'):
         # Use mean average
         inv_count = 1. / float(len(positions))
         return manual_probe.ProbeResult(
-            *[sum([pos[i] for pos in positions]) * inv_count
-              for i in range(len(positions[0]))])
+            *[sum(vals) * inv_count for vals in zip(*positions)])
     # Use median
     z_sorted = sorted(positions, key=(lambda p: p.bed_z))
     middle = len(positions) // 2
@@ -366,10 +365,6 @@ class ProbeSessionHelper:
         self.hw_probe_session = None
         hw_probe_session.end_probe_session()
     def _probe(self, gcmd):
-        toolhead = self.printer.lookup_object('toolhead')
-        curtime = self.printer.get_reactor().monotonic()
-        if 'z' not in toolhead.get_status(curtime)['homed_axes']:
-            raise self.printer.command_error("Must home before probe")
         try:
             self.hw_probe_session.run_probe(gcmd)
             epos = self.hw_probe_session.pull_probed_results()[0]
@@ -390,6 +385,9 @@ class ProbeSessionHelper:
             self._probe_state_error()
         params = self.param_helper.get_probe_params(gcmd)
         toolhead = self.printer.lookup_object('toolhead')
+        curtime = self.printer.get_reactor().monotonic()
+        if 'z' not in toolhead.get_status(curtime)['homed_axes']:
+            raise self.printer.command_error("Must home before probe")
         probexy = toolhead.get_position()[:2]
         retries = 0
         positions = []
@@ -130,7 +130,7 @@ class SHT3X:
                 )
             else:
                 self.temp = -45 + (175 * rtemp / 65535)
-                logging.debug("sht3x: Temperature %.2f " % self.temp)
+                logging.debug("sht3x: Temperature %.2f ", self.temp)
 
             rhumid  = response[3] << 8
             rhumid |= response[4]
@@ -138,7 +138,7 @@ class SHT3X:
                 logging.warning("sht3x: Checksum error on Humidity reading!")
             else:
                 self.humidity = 100 * rhumid / 65535
-                logging.debug("sht3x: Humidity %.2f " % self.humidity)
+                logging.debug("sht3x: Humidity %.2f ", self.humidity)
 
         except Exception:
             logging.exception("sht3x: Error reading data")